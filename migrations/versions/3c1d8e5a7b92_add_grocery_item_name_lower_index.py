@@ -0,0 +1,34 @@
+"""add_grocery_item_name_lower_index
+
+Revision ID: 3c1d8e5a7b92
+Revises: 0244e9c0e804
+Create Date: 2026-10-17 09:12:44.418203
+
+"""
+
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1d8e5a7b92"
+down_revision: Union[str, Sequence[str], None] = "0244e9c0e804"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Expression index so case-insensitive name lookups avoid a table scan
+    op.create_index(
+        "idx_grocery_items_name_lower",
+        "grocery_items",
+        [sa.text("lower(name)")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_grocery_items_name_lower", table_name="grocery_items")
@@ -61,6 +61,11 @@ class Config:
 
     # Scheduling Configuration
     TIMEZONE = os.environ.get("TIMEZONE", settings.timezone)
+    AUTOMATIONS_LIST_CACHE_TTL = float(
+        os.environ.get(
+            "AUTOMATIONS_LIST_CACHE_TTL", settings.automations_list_cache_ttl
+        )
+    )
 
     # Public URL Configuration
     PUBLIC_URL_MODE = os.environ.get("PUBLIC_URL_MODE", settings.public_url_mode)
@@ -162,7 +162,14 @@ def _to_settings_dict(self) -> Dict[str, Any]:
 def create_settings_form() -> type[FlaskForm]:
     """Dynamically create a settings form from the Pydantic Settings model."""
     # Fields to exclude from the form (internal/hidden fields)
-    excluded_fields = {"debug", "log_level", "secret_key", "database_name", "data_dir"}
+    excluded_fields = {
+        "debug",
+        "log_level",
+        "secret_key",
+        "database_name",
+        "data_dir",
+        "automations_list_cache_ttl",
+    }
 
     # Build form fields dynamically
     form_fields = {}
@@ -8,6 +8,7 @@ from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import Text
@@ -43,6 +44,9 @@ class GroceryItem(Base):
     order_items = relationship("OrderItem", back_populates="item")
     shopping_list_entries = relationship("ShoppingList", back_populates="item")
 
+    # Matches the lower(name) predicate used for case-insensitive lookups
+    __table_args__ = (Index("idx_grocery_items_name_lower", func.lower(name)),)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 
 from sqlalchemy import JSON
@@ -92,6 +93,30 @@ class ScheduledTask(Base):
         await session.refresh(task)
         return task
 
+    @staticmethod
+    async def create_tasks(
+        session: AsyncSession, tasks: List[Dict[str, Any]]
+    ) -> List["ScheduledTask"]:
+        """Create several scheduled tasks in a single commit.
+
+        Each entry takes the same keyword arguments as create_task.
+        """
+        created = [
+            ScheduledTask(
+                id=str(task["task_id"]),
+                job_id=task["job_id"],
+                conversation_id=task["conversation_id"],
+                agent_instructions=task["agent_instructions"],
+                schedule_type=task["schedule_type"],
+                schedule_config=task["schedule_config"],
+                interactive=task.get("interactive", True),
+            )
+            for task in tasks
+        ]
+        session.add_all(created)
+        await session.commit()
+        return created
+
     async def update_status(
         self,
         session: AsyncSession,
@@ -85,6 +85,10 @@ class Settings(BaseModel):
         default="./data",
         description="Directory for storing database and persistent data",
     )
+    automations_list_cache_ttl: float = Field(
+        default=3.0,
+        description="Seconds the automations_list tool may reuse its last result",
+    )
 
     @field_validator("openrouter_api_key")
     @classmethod
@@ -171,6 +175,8 @@ class Settings(BaseModel):
                 # Convert to appropriate type
                 if field_info.annotation is int:
                     settings_dict[field_name] = int(env_value)
+                elif field_info.annotation is float:
+                    settings_dict[field_name] = float(env_value)
                 elif field_info.annotation is bool:
                     settings_dict[field_name] = env_value.lower() in (
                         "true",
@@ -48,11 +48,13 @@ class AssistanceMonitor:
             f"Monitoring for human assistance completion, initial URL: {initial_url}"
         )
 
+        # Look the session up once; its completion event ends the waits below early
+        assistance_service = current_app.extensions["human_assistance_service"]
+        session = assistance_service.active_sessions.get(session_id)
+
         while time.time() - start_time < timeout:
             try:
                 # Check if user manually marked as done
-                assistance_service = current_app.extensions["human_assistance_service"]
-                session = assistance_service.active_sessions.get(session_id)
                 if session and session.completed:
                     current_app.logger.info(
                         "User manually marked assistance as complete"
@@ -76,7 +78,14 @@ class AssistanceMonitor:
             except Exception as e:
                 current_app.logger.error(f"Error monitoring assistance: {e}")
 
-            await asyncio.sleep(1)
+            # Wait for the next URL check, waking early if the user clicks "Done"
+            if session:
+                try:
+                    await asyncio.wait_for(session.completed_event.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(1)
 
         current_app.logger.warning("Assistance monitoring timeout")
         return False
@@ -0,0 +1,58 @@
+"""Coalescing of concurrent calls into batched handler calls."""
+
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import List
+from typing import Optional
+
+
+class BatchCoalescer:
+    """Hand items submitted concurrently to a single batch handler call.
+
+    A submission made while the coalescer is idle is flushed on the next event
+    loop iteration, together with anything else submitted in the same
+    iteration. Items submitted while a flush is running form the next batch.
+    """
+
+    def __init__(self, handler: Callable[[List[Any]], Awaitable[List[Any]]]):
+        """Initialise the coalescer.
+
+        Args:
+            handler: Async callable taking a batch of items and returning one
+                result per item, in order. A returned exception instance fails
+                only that item's submission; a raised one fails the whole batch.
+        """
+        self.handler = handler
+        self._pending = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def submit(self, item: Any) -> asyncio.Future:
+        """Queue an item for the next batch.
+
+        Returns:
+            Future resolved with the handler's result for the item
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+        return future
+
+    async def _flush(self):
+        """Run the handler until no submissions are left waiting."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                results = await self.handler([item for item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
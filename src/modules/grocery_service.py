@@ -10,8 +10,12 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 
+from sqlalchemy import delete
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import func
 
 from src.models.grocery import GroceryItem
 from src.models.grocery import GroceryOrder
@@ -24,6 +28,9 @@ logger = logging.getLogger(__name__)
 async def find_or_create_item(session: AsyncSession, name: str) -> GroceryItem:
     """Find existing grocery item by name (case-insensitive) or create new one.
 
+    New items are flushed but not committed; callers commit as part of their
+    own unit of work.
+
     Args:
         session: Database session
         name: Item name (case-insensitive)
@@ -37,23 +44,24 @@ async def find_or_create_item(session: AsyncSession, name: str) -> GroceryItem:
     if not item:
         # Create new item with normalized name (capitalize each word)
         normalized_name = " ".join(word.capitalize() for word in name.split())
-        item = await GroceryItem.create_item(session, name=normalized_name)
+        item = GroceryItem(name=normalized_name)
+        session.add(item)
+        await session.flush()
         logger.info(f"Created new grocery item: {normalized_name}")
 
     return item
 
 
-async def update_item_frequency(session: AsyncSession, item_id: int) -> None:
+async def update_item_frequency(session: AsyncSession, item: GroceryItem) -> None:
     """Recalculate base_frequency_days and typical_quantity from purchase history.
 
+    Changes are applied to the item but not committed.
+
     Args:
         session: Database session
-        item_id: Grocery item ID
+        item: Grocery item to update
     """
-    item = await GroceryItem.get_by_id(session, item_id)
-    if not item:
-        logger.warning(f"Item {item_id} not found for frequency update")
-        return
+    item_id = item.id
 
     # Get recent purchases (order_items with order dates)
     query = (
@@ -98,17 +106,79 @@ async def update_item_frequency(session: AsyncSession, item_id: int) -> None:
         typical_qty = median(quantities)
 
     # Update item
-    await item.update(
-        session,
-        base_frequency_days=base_frequency,
-        typical_quantity=typical_qty,
-    )
+    item.base_frequency_days = base_frequency
+    item.typical_quantity = typical_qty
 
     logger.info(
         f"Updated item {item.name}: frequency={base_frequency} days, qty={typical_qty}"
     )
 
 
+async def _add_order(
+    session: AsyncSession,
+    supermarket: str,
+    items: List[Dict],
+    order_date: Optional[date] = None,
+    total_cost: Optional[float] = None,
+) -> Tuple[GroceryOrder, int]:
+    """Add an order and its items to the session without committing."""
+    if order_date is None:
+        order_date = date.today()
+
+    order = GroceryOrder(
+        supermarket=supermarket,
+        order_date=order_date,
+        total_cost=total_cost,
+    )
+    session.add(order)
+    await session.flush()
+
+    grocery_items = []
+    for item_data in items:
+        grocery_items.append(await find_or_create_item(session, item_data["name"]))
+
+    if not grocery_items:
+        return order, 0
+
+    await session.execute(
+        insert(OrderItem),
+        [
+            {
+                "order_id": order.id,
+                "item_id": grocery_item.id,
+                "quantity": item_data["quantity"],
+                "unit_price": item_data.get("unit_price"),
+                "total_price": item_data.get("total_price"),
+            }
+            for item_data, grocery_item in zip(items, grocery_items)
+        ],
+    )
+
+    updated_frequencies = 0
+
+    for grocery_item in grocery_items:
+        # Update last purchased date
+        grocery_item.last_purchased_date = order_date
+
+        # Update frequency if item has >= 2 purchases
+        await update_item_frequency(session, grocery_item)
+
+        # Check if frequency was set (meaning >= 2 purchases)
+        if grocery_item.base_frequency_days is not None:
+            updated_frequencies += 1
+
+    # Remove purchased items from shopping list
+    result = await session.execute(
+        delete(ShoppingList).where(
+            ShoppingList.item_id.in_([item.id for item in grocery_items])
+        )
+    )
+    if result.rowcount:
+        logger.debug(f"Removed {result.rowcount} purchased items from shopping list")
+
+    return order, updated_frequencies
+
+
 async def record_order(
     session: AsyncSession,
     supermarket: str,
@@ -128,53 +198,56 @@ async def record_order(
     Returns:
         Tuple of (GroceryOrder, number of items with updated frequencies)
     """
-    if order_date is None:
-        order_date = date.today()
-
-    order = await GroceryOrder.create_order(
+    order, updated_frequencies = await _add_order(
         session,
         supermarket=supermarket,
+        items=items,
         order_date=order_date,
         total_cost=total_cost,
     )
+    await session.commit()
 
-    updated_frequencies = 0
+    logger.info(
+        f"Recorded order from {supermarket} with {len(items)} items, "
+        f"updated frequencies for {updated_frequencies} items"
+    )
 
-    for item_data in items:
-        grocery_item = await find_or_create_item(session, item_data["name"])
+    return order, updated_frequencies
 
-        await OrderItem.create_order_item(
-            session,
-            order_id=order.id,
-            item_id=grocery_item.id,
-            quantity=item_data["quantity"],
-            unit_price=item_data.get("unit_price"),
-            total_price=item_data.get("total_price"),
-        )
 
-        # Update last purchased date
-        await grocery_item.update(session, last_purchased_date=order_date)
+async def record_orders(
+    session: AsyncSession, orders: List[Dict]
+) -> List[Tuple[GroceryOrder, int]]:
+    """Record several grocery orders in a single transaction.
 
-        # Update frequency if item has >= 2 purchases
-        await update_item_frequency(session, grocery_item.id)
+    Orders are applied in the given order so frequency calculations see
+    earlier orders in the batch.
 
-        # Check if frequency was set (meaning >= 2 purchases)
-        await session.refresh(grocery_item)
-        if grocery_item.base_frequency_days is not None:
-            updated_frequencies += 1
+    Args:
+        session: Database session
+        orders: List of dicts with keys: supermarket, items, order_date (optional),
+            total_cost (optional); see record_order for the item format
 
-        # Remove from shopping list if present
-        shopping_entry = await ShoppingList.get_by_item(session, grocery_item.id)
-        if shopping_entry:
-            await shopping_entry.delete(session)
-            logger.debug(f"Removed {grocery_item.name} from shopping list")
+    Returns:
+        List of (GroceryOrder, number of items with updated frequencies) tuples,
+        one per input order
+    """
+    results = []
+    for order_data in orders:
+        results.append(
+            await _add_order(
+                session,
+                supermarket=order_data["supermarket"],
+                items=order_data["items"],
+                order_date=order_data.get("order_date"),
+                total_cost=order_data.get("total_cost"),
+            )
+        )
+    await session.commit()
 
-    logger.info(
-        f"Recorded order from {supermarket} with {len(items)} items, "
-        f"updated frequencies for {updated_frequencies} items"
-    )
+    logger.info(f"Recorded {len(orders)} orders in one batch")
 
-    return order, updated_frequencies
+    return results
 
 
 async def calculate_predictions(
@@ -324,6 +397,9 @@ async def add_to_shopping_list(
         await existing.update(
             session, quantity_needed=quantity, urgency=urgency, notes=notes
         )
+        # Attach the already-loaded item so callers can read entry.item
+        # without triggering a lazy load
+        set_committed_value(existing, "item", item)
         logger.info(f"Updated {item.name} in shopping list (urgency: {urgency})")
         return existing, item.name
     else:
@@ -334,6 +410,7 @@ async def add_to_shopping_list(
             urgency=urgency,
             notes=notes,
         )
+        set_committed_value(entry, "item", item)
         logger.info(f"Added {item.name} to shopping list (urgency: {urgency})")
         return entry, item.name
 
@@ -360,18 +437,19 @@ async def remove_from_shopping_list(
         logger.warning(f"Item '{item_name}' not found")
         return None
 
-    shopping_entry = await ShoppingList.get_by_item(session, item.id)
-    if shopping_entry:
-        await shopping_entry.delete(session)
+    # Delete and frequency adjustment share a single commit
+    await session.execute(delete(ShoppingList).where(ShoppingList.item_id == item.id))
 
     message = f"Removed {item.name} from shopping list"
 
     if adjust_frequency:
         adjustment_days = frequency_adjustment_weeks * 7
         new_adjustment = (item.frequency_adjustment_days or 0) + adjustment_days
-        await item.update(session, frequency_adjustment_days=new_adjustment)
+        item.frequency_adjustment_days = new_adjustment
         message += f" and adjusted frequency by +{frequency_adjustment_weeks} weeks"
 
+    await session.commit()
+
     logger.info(message)
     return message
 
@@ -389,20 +467,27 @@ async def get_item_history(
     Returns:
         Dict with history data or None if not found
     """
-    item = await GroceryItem.get_by_name(session, item_name)
-    if not item:
-        return None
-
-    # Get recent order items with order details
+    # Fetch the item and its recent purchases in one round trip. Items with
+    # no purchases yield a single row with empty order columns. At least one
+    # row is fetched so the item is found even when no purchases are wanted.
     query = (
-        select(OrderItem, GroceryOrder)
-        .join(GroceryOrder)
-        .where(OrderItem.item_id == item.id)
+        select(GroceryItem, OrderItem, GroceryOrder)
+        .outerjoin(OrderItem, OrderItem.item_id == GroceryItem.id)
+        .outerjoin(GroceryOrder, GroceryOrder.id == OrderItem.order_id)
+        .where(func.lower(GroceryItem.name) == func.lower(item_name))
         .order_by(GroceryOrder.order_date.desc())
-        .limit(limit)
+        .limit(max(limit, 1))
     )
-    result = await session.execute(query)
-    purchases = [(order_item, order) for order_item, order in result.all()]
+    rows = (await session.execute(query)).all()
+    if not rows:
+        return None
+
+    item = rows[0][0]
+    purchases = [
+        (order_item, order)
+        for _, order_item, order in rows[: max(limit, 0)]
+        if order is not None
+    ]
 
     # Calculate statistics
     if purchases:
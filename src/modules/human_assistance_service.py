@@ -4,6 +4,7 @@ import asyncio
 import secrets
 import time
 from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +22,8 @@ class AssistanceSession:
     reason: str
     created_at: float
     completed: bool = False
+    # Set alongside completed so waiters wake as soon as the user clicks "Done"
+    completed_event: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class HumanAssistanceService:
@@ -113,5 +116,7 @@ class HumanAssistanceService:
     def mark_session_complete(self, session_id: str):
         """Mark assistance session as completed."""
         if session_id in self.active_sessions:
-            self.active_sessions[session_id].completed = True
+            session = self.active_sessions[session_id]
+            session.completed = True
+            session.completed_event.set()
             current_app.logger.info(f"Assistance session {session_id} completed")
@@ -28,6 +28,7 @@ from typing import Optional
 from quart import current_app
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from src.modules.batching import BatchCoalescer
 from src.modules.vector_generator import VectorGenerator
 
 try:
@@ -60,6 +61,9 @@ class MemoryService:
         self.vector_generator = None
         self.bulk_mode = False
 
+        # Concurrent query embeddings share one model invocation
+        self._vector_batcher = BatchCoalescer(self._generate_vector_batch)
+
         # Decay parameters
         self.decay_constant = 86400 * 7  # 1 week in seconds
         self.min_strength_threshold = 0.1
@@ -279,6 +283,31 @@ class MemoryService:
             role=role,
         )
 
+    async def generate_vectors_batched(
+        self,
+        content: str,
+        role: str,
+        timestamp: Optional[float] = None,
+        context_tags: Optional[List[str]] = None,
+    ) -> Dict[str, List[float]]:
+        """Generate vectors, coalescing concurrent calls into one model invocation.
+
+        Calls made while another batch is being generated share the next
+        semantic embedding batch. Takes the same arguments as generate_vectors.
+        """
+        return await self._vector_batcher.submit({
+            "content": content,
+            "timestamp": timestamp,
+            "context_tags": context_tags,
+            "role": role,
+        })
+
+    async def _generate_vector_batch(self, requests):
+        """Generate vectors for a batch of generate_vectors argument dicts."""
+        return await asyncio.to_thread(
+            self.vector_generator.generate_all_batch, requests
+        )
+
     def _calculate_memory_strength(
         self, payload: Dict[str, Any], current_time: Optional[float] = None
     ) -> float:
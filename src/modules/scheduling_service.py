@@ -1,8 +1,14 @@
 """Scheduling service using APScheduler with PostgreSQL backend."""
 
+import asyncio
+import weakref
+from contextlib import AsyncExitStack
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -13,6 +19,7 @@ from quart import current_app
 from sqlalchemy.future import select
 
 from src.models.scheduled_task import ScheduledTask
+from src.modules.batching import BatchCoalescer
 
 
 class SchedulingService:
@@ -21,6 +28,10 @@ class SchedulingService:
     def __init__(self, app=None):
         self.scheduler = None
         self.db = None
+        self._task_writer = BatchCoalescer(self._store_tasks)
+        # Queued or in-flight tasks, by ID, until their job has been added
+        self._unsaved_tasks = {}
+        self._conversation_locks = weakref.WeakValueDictionary()
         if app is not None:
             self.init_app(app)
 
@@ -193,49 +204,275 @@ class SchedulingService:
         Returns:
             APScheduler job ID
         """
-        # Create trigger based on schedule type with clean unpacking
+        # Store the task and add its job, sharing a commit with concurrent calls
+        await self._queue_task({
+            "task_id": task_id,
+            "conversation_id": conversation_id,
+            "agent_instructions": agent_instructions,
+            "schedule_type": schedule_type,
+            "schedule_config": schedule_config,
+            "interactive": interactive,
+            "max_retries": max_retries,
+        })
+
+        current_app.logger.info(f"Scheduled agent task {task_id} with job ID {task_id}")
+        return task_id
+
+    async def schedule_unless_duplicate(
+        self,
+        task_id: str,
+        conversation_id: str,
+        agent_instructions: str,
+        schedule_type: str,
+        schedule_config: Dict[str, Any],
+        interactive: bool = True,
+        max_retries: int = 3,
+    ) -> Tuple[str, bool]:
+        """Schedule an agent execution task unless an identical one exists.
+
+        Takes the same arguments as schedule_agent_execution.
+
+        Returns:
+            Tuple of (job ID, whether a new job was scheduled)
+        """
+        (outcome,) = await self.schedule_many_unless_duplicate([{
+            "task_id": task_id,
+            "conversation_id": conversation_id,
+            "agent_instructions": agent_instructions,
+            "schedule_type": schedule_type,
+            "schedule_config": schedule_config,
+            "interactive": interactive,
+            "max_retries": max_retries,
+        }])
+        return outcome
+
+    async def schedule_many_unless_duplicate(
+        self, tasks: List[Dict[str, Any]]
+    ) -> List[Tuple[str, bool]]:
+        """Schedule several agent execution tasks, skipping identical ones.
+
+        The duplicate lookups run under per-conversation locks, so concurrent
+        identical requests schedule a single job. The new tasks are stored in a
+        single transaction, and repeats within the list are scheduled once.
+
+        Args:
+            tasks: schedule_agent_execution keyword arguments for each task
+
+        Returns:
+            One tuple of (job ID, whether a new job was scheduled) per task
+        """
+        outcomes = []
+        new_tasks = []
+        async with AsyncExitStack() as locks:
+            # Lock in a fixed order so overlapping calls cannot deadlock
+            for conversation_id in sorted(
+                {task["conversation_id"] for task in tasks}, key=str
+            ):
+                await locks.enter_async_context(
+                    self._conversation_lock(conversation_id)
+                )
+
+            for task in tasks:
+                repeated = [
+                    new_task["task_id"]
+                    for new_task in new_tasks
+                    if self._is_same_task(new_task, task)
+                ]
+                if repeated:
+                    existing_job_id = repeated[0]
+                else:
+                    existing_job_id = await self.find_duplicate_task(
+                        conversation_id=task["conversation_id"],
+                        agent_instructions=task["agent_instructions"],
+                        schedule_type=task["schedule_type"],
+                        schedule_config=task["schedule_config"],
+                    )
+                if existing_job_id is not None:
+                    outcomes.append((existing_job_id, False))
+                else:
+                    new_tasks.append(task)
+                    outcomes.append((task["task_id"], True))
+
+            # Queued tasks are visible to find_duplicate_task, so the write can
+            # be awaited outside the locks. Queue them together to share a batch.
+            stored = [self._queue_task(task) for task in new_tasks]
+
+        await asyncio.gather(*stored)
+        for task in new_tasks:
+            current_app.logger.info(
+                f"Scheduled agent task {task['task_id']} with job ID {task['task_id']}"
+            )
+        return outcomes
+
+    def _conversation_lock(self, conversation_id: Optional[str]) -> asyncio.Lock:
+        """Get the lock serialising duplicate checks for a conversation."""
+        lock = self._conversation_locks.get(conversation_id)
+        if lock is None:
+            lock = self._conversation_locks[conversation_id] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _is_same_task(task: Dict[str, Any], other: Dict[str, Any]) -> bool:
+        """Check whether two tasks would run the same instructions on one schedule."""
+        return all(
+            task[field] == other[field]
+            for field in (
+                "conversation_id",
+                "agent_instructions",
+                "schedule_type",
+                "schedule_config",
+            )
+        )
+
+    async def find_duplicate_task(
+        self,
+        conversation_id: Optional[str],
+        agent_instructions: str,
+        schedule_type: str,
+        schedule_config: Dict[str, Any],
+    ) -> Optional[str]:
+        """Find a still-scheduled task identical to the one described.
+
+        Tasks whose records are still waiting to be written count as scheduled.
+
+        Returns:
+            The existing APScheduler job ID, or None if there is no live duplicate
+        """
+        wanted = {
+            "conversation_id": conversation_id,
+            "agent_instructions": agent_instructions,
+            "schedule_type": schedule_type,
+            "schedule_config": schedule_config,
+        }
+        for task in self._unsaved_tasks.values():
+            if self._is_same_task(task, wanted):
+                return task["task_id"]
+
+        async with self.db.session_factory() as session:
+            result = await session.execute(
+                select(ScheduledTask.job_id, ScheduledTask.schedule_config)
+                .where(
+                    ScheduledTask.conversation_id == conversation_id,
+                    ScheduledTask.agent_instructions == agent_instructions,
+                    ScheduledTask.schedule_type == schedule_type,
+                )
+                .order_by(ScheduledTask.created_at.desc())
+            )
+            matching = [
+                job_id for job_id, config in result.all() if config == schedule_config
+            ]
+
+        # Recurring tasks are marked completed after each run, so the job itself
+        # is the authority on whether a task is still scheduled. Reading it
+        # unpickles from the jobstore, so keep that off the event loop.
+        for job_id in matching:
+            if await asyncio.to_thread(self.scheduler.get_job, job_id):
+                return job_id
+        return None
+
+    def _queue_task(self, task: Dict[str, Any]) -> asyncio.Future:
+        """Queue a task to be stored and then added to the scheduler.
+
+        Returns:
+            Future resolved once the task is stored and its job added
+        """
+        trigger = self._build_trigger(task["schedule_type"], task["schedule_config"])
+        self._unsaved_tasks[task["task_id"]] = task
+        return self._task_writer.submit((task, trigger))
+
+    def _build_trigger(self, schedule_type: str, schedule_config: Dict[str, Any]):
+        """Create the APScheduler trigger for a schedule."""
         if schedule_type == "once":
-            trigger = DateTrigger(
-                run_date=datetime.fromisoformat(schedule_config["when"])
+            # Naive times are in the scheduler's zone, as setup_automation assumes
+            return DateTrigger(
+                run_date=datetime.fromisoformat(schedule_config["when"]),
+                timezone=self.scheduler.timezone,
             )
         elif schedule_type == "cron":
-            trigger = CronTrigger(**schedule_config)
+            return CronTrigger(**schedule_config)
         elif schedule_type == "interval":
-            trigger = IntervalTrigger(**schedule_config)
-        else:
-            raise ValueError(f"Unsupported schedule type: {schedule_type}")
-
-        # Create job
-        self.scheduler.add_job(
-            func=SchedulingService._execute_scheduled_agent,
-            trigger=trigger,
-            id=task_id,
-            args=[
-                task_id,
-                conversation_id,
-                agent_instructions,
-                max_retries,
-                interactive,
-            ],
-            name=agent_instructions,
-            replace_existing=True,
-        )
+            return IntervalTrigger(**schedule_config)
+        raise ValueError(f"Unsupported schedule type: {schedule_type}")
 
-        # Store task in database
-        async with self.db.session_factory() as session:
-            await ScheduledTask.create_task(
-                session=session,
-                task_id=task_id,
-                job_id=task_id,
-                conversation_id=conversation_id,
-                agent_instructions=agent_instructions,
-                schedule_type=schedule_type,
-                schedule_config=schedule_config,
-                interactive=interactive,
+    async def _store_tasks(self, batch) -> List[Optional[Exception]]:
+        """Store a batch of queued tasks, then add the jobs of those stored.
+
+        A job is only added once its task record is committed, so it never runs
+        without one.
+
+        Returns:
+            None for each task scheduled, or the exception that stopped it
+        """
+        tasks = [task for task, _ in batch]
+        try:
+            try:
+                async with self.db.session_factory() as session:
+                    await ScheduledTask.create_tasks(
+                        session, [self._task_record(task) for task in tasks]
+                    )
+                results = [None] * len(tasks)
+            except Exception as e:
+                current_app.logger.warning(
+                    f"Batched write of {len(tasks)} scheduled tasks failed,"
+                    f" retrying individually: {e}"
+                )
+                results = [await self._store_task(task) for task in tasks]
+
+            for i, (task, trigger) in enumerate(batch):
+                if results[i] is None:
+                    results[i] = await self._add_job(task, trigger)
+            return results
+        finally:
+            for task in tasks:
+                self._unsaved_tasks.pop(task["task_id"], None)
+
+    async def _store_task(self, task: Dict[str, Any]) -> Optional[Exception]:
+        """Write one task on its own so a bad record only fails its caller."""
+        try:
+            async with self.db.session_factory() as session:
+                await ScheduledTask.create_task(session, **self._task_record(task))
+        except Exception as e:
+            current_app.logger.error(
+                f"Failed to store scheduled task {task['task_id']}: {e}"
             )
+            return e
+        return None
 
-        current_app.logger.info(f"Scheduled agent task {task_id} with job ID {task_id}")
-        return task_id
+    async def _add_job(self, task: Dict[str, Any], trigger) -> Optional[Exception]:
+        """Add the APScheduler job for a stored task."""
+        try:
+            self.scheduler.add_job(
+                func=SchedulingService._execute_scheduled_agent,
+                trigger=trigger,
+                id=task["task_id"],
+                args=[
+                    task["task_id"],
+                    task["conversation_id"],
+                    task["agent_instructions"],
+                    task["max_retries"],
+                    task["interactive"],
+                ],
+                name=task["agent_instructions"],
+                replace_existing=True,
+            )
+        except Exception as e:
+            current_app.logger.error(
+                f"Failed to add job for scheduled task {task['task_id']}: {e}"
+            )
+            # A pending record without a job would be restored on restart
+            async with self.db.session_factory() as session:
+                record = await ScheduledTask.get_by_id(session, task["task_id"])
+                if record is not None:
+                    await record.delete(session)
+            return e
+        return None
+
+    @staticmethod
+    def _task_record(task: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the ScheduledTask fields of a queued task, whose job shares its ID."""
+        record = dict(task, job_id=task["task_id"])
+        del record["max_retries"]
+        return record
 
     @staticmethod
     async def _execute_scheduled_agent(
@@ -66,6 +66,7 @@ class CommunicationChannel(ABC):
             "duckduckgo_search": "Searching the web...",
             "browse_web": "Using the web browser...",
             "record_grocery_order": "Recording grocery order...",
+            "record_grocery_orders": "Recording grocery orders...",
             "get_shopping_predictions": "Analyzing shopping patterns...",
             "add_to_shopping_list": "Adding to shopping list...",
             "remove_from_shopping_list": "Removing from shopping list...",
@@ -74,6 +75,8 @@ class CommunicationChannel(ABC):
             "get_item_history": "Looking up item history...",
             "memory_search": "Searching my memory...",
             "setup_automation": "Setting up automation...",
+            "setup_automations": "Setting up automations...",
+            "scheduling_help": "Reading scheduling guide...",
             "automations_list": "Listing automations...",
             "delete_automation": "Deleting automation...",
             "todo_read": "Reading todos...",
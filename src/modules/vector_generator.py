@@ -80,6 +80,32 @@ class SemanticVectorGenerator:
             # Use fallback word frequency embedding
             return self._fallback_embedding(text)
 
+    def generate_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate semantic embeddings for several texts in one model call.
+
+        Args:
+            texts: Input texts to encode
+
+        Returns:
+            List of embeddings, in the same order as the input texts
+        """
+        embeddings = [[0.0] * self.vector_size for _ in texts]
+        to_embed = [
+            (i, text.strip()) for i, text in enumerate(texts) if text and text.strip()
+        ]
+        if not to_embed:
+            return embeddings
+
+        if self.use_fastembed:
+            vectors = self.model.embed([text for _, text in to_embed])
+            for (i, _), vector in zip(to_embed, vectors):
+                embeddings[i] = vector.tolist()
+        else:
+            for i, text in to_embed:
+                embeddings[i] = self._fallback_embedding(text)
+
+        return embeddings
+
 
 class TemporalVectorGenerator:
     """Generates temporal embeddings from time information."""
@@ -286,6 +312,30 @@ class VectorGenerator:
             "role": self.role_generator.generate(role),
         }
 
+    def generate_all_batch(self, requests: List[Dict]) -> List[Dict[str, List[float]]]:
+        """Generate all vector types for several inputs, batching the semantic model.
+
+        Args:
+            requests: List of dicts with the keyword arguments of generate_all
+
+        Returns:
+            List of vector dicts, in the same order as the requests
+        """
+        semantic = self.semantic_generator.generate_batch(
+            [request["content"] for request in requests]
+        )
+        return [
+            {
+                "semantic": semantic_vector,
+                "temporal": self.temporal_generator.generate(request.get("timestamp")),
+                "contextual": self.contextual_generator.generate(
+                    request.get("context_tags")
+                ),
+                "role": self.role_generator.generate(request.get("role", "user")),
+            }
+            for request, semantic_vector in zip(requests, semantic)
+        ]
+
     def get_vector_sizes(self) -> Dict[str, int]:
         """Get the sizes of each vector type."""
         return {
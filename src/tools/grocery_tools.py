@@ -1,7 +1,9 @@
 """Grocery shopping prediction tools for AI agent."""
 
-from datetime import datetime
+from datetime import date
+from operator import itemgetter
 from typing import List
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -9,11 +11,25 @@ from pydantic_ai import RunContext
 from pydantic_ai.toolsets import FunctionToolset
 from quart import current_app
 
+from src.models.grocery import ShoppingList
 from src.modules import grocery_service
 
 # Create toolset for grocery tools
 grocery_toolset = FunctionToolset()
 
+_URGENCY_EMOJI = {"high": "‼️", "normal": "⚠️", "low": "ℹ️"}
+_DEFAULT_URGENCY_EMOJI = "⚠️"
+
+_PREDICTION_FIELDS = itemgetter(
+    "item_name",
+    "quantity",
+    "unit_type",
+    "priority_score",
+    "reason",
+    "is_urgent",
+    "urgency_level",
+)
+
 
 class OrderItemInput(BaseModel):
     """Single item in a grocery order."""
@@ -36,7 +52,7 @@ class GroceryOrderInput(BaseModel):
         description="Store name, e.g., 'Tesco', 'New World', 'Countdown'"
     )
     items: List[OrderItemInput] = Field(description="List of items purchased")
-    order_date: str | None = Field(
+    order_date: date | None = Field(
         None, description="Order date (YYYY-MM-DD), defaults to today"
     )
     total_cost: float | None = Field(None, description="Optional total order cost")
@@ -60,12 +76,87 @@ class ShoppingListInput(BaseModel):
     quantity: float | None = Field(
         None, description="Optional specific quantity needed"
     )
-    urgency: str = Field(
+    urgency: Literal["low", "normal", "high"] = Field(
         "normal", description="Urgency level: 'low', 'normal', or 'high'"
     )
     notes: str | None = Field(None, description="Optional user notes")
 
 
+def _format_order_summary(order: dict, updated_count: int) -> str:
+    """Summarise a recorded order for the agent."""
+    item_count = len(order["items"])
+    response = f"✅ Recorded order from {order['supermarket']} with {item_count} items."
+
+    if updated_count > 0:
+        response += (
+            f" Updated frequencies for {updated_count} items (had 2+ purchases)."
+        )
+    elif item_count > 0:
+        response += (
+            " First purchase for these items - I'll start learning patterns"
+            " after the next purchase."
+        )
+
+    return response
+
+
+def _format_prediction(index: int, pred: dict) -> str:
+    """Format a single shopping prediction as a multi-line block."""
+    (
+        item_name,
+        quantity,
+        unit_type,
+        priority_score,
+        reason,
+        is_urgent,
+        urgency_level,
+    ) = _PREDICTION_FIELDS(pred)
+
+    quantity_text = ""
+    if quantity and unit_type:
+        quantity_text = f"\n   - Quantity: {quantity} {unit_type}"
+    elif quantity:
+        quantity_text = f"\n   - Quantity: {quantity}"
+
+    urgent = ""
+    if is_urgent:
+        urgency_emoji = _URGENCY_EMOJI.get(urgency_level, _DEFAULT_URGENCY_EMOJI)
+        urgent = f"\n   - {urgency_emoji} URGENT (on shopping list)"
+
+    return (
+        f"{index}. **{item_name}** (Confidence: {priority_score})"
+        f"{quantity_text}\n   - {reason}{urgent}"
+    )
+
+
+def _format_shopping_list_entry(index: int, entry) -> str:
+    """Format a single shopping list entry as a multi-line block."""
+    quantity = ""
+    if entry.quantity_needed:
+        if entry.item.unit_type:
+            quantity = (
+                f"\n   - Quantity: {entry.quantity_needed} {entry.item.unit_type}"
+            )
+        else:
+            quantity = f"\n   - Quantity: {entry.quantity_needed}"
+
+    notes = f"\n   - Note: {entry.notes}" if entry.notes else ""
+
+    return f"{index}. {entry.item.name}{quantity}{notes}"
+
+
+def _format_purchase(index: int, purchase: dict) -> str:
+    """Format a single purchase history entry."""
+    price_text = ""
+    if purchase["unit_price"]:
+        price_text = f" @ ${purchase['unit_price']:.2f}"
+
+    return (
+        f"{index}. {purchase['date']} -"
+        f" {purchase['quantity']}{price_text} ({purchase['supermarket']})"
+    )
+
+
 @grocery_toolset.tool
 async def record_grocery_order(
     ctx: RunContext[dict], order_data: GroceryOrderInput
@@ -95,57 +186,59 @@ async def record_grocery_order(
         f"🔧 TOOL CALLED: record_grocery_order for {order_data.supermarket}"
     )
 
-    order_date = None
-    if order_data.order_date:
-        try:
-            order_date = datetime.strptime(order_data.order_date, "%Y-%m-%d").date()
-        except ValueError:
-            return (
-                f"Error: Invalid date format '{order_data.order_date}'. Use YYYY-MM-DD."
-            )
-
-    items = [
-        {
-            "name": item.name,
-            "quantity": item.quantity,
-            "unit_price": item.unit_price,
-            "total_price": item.total_price,
-        }
-        for item in order_data.items
-    ]
+    order = order_data.model_dump()
 
     db = current_app.extensions["database"]
     async with db.session_factory() as session:
         try:
-            order, updated_count = await grocery_service.record_order(
-                session,
-                supermarket=order_data.supermarket,
-                items=items,
-                order_date=order_date,
-                total_cost=order_data.total_cost,
-            )
+            _, updated_count = await grocery_service.record_order(session, **order)
+            return _format_order_summary(order, updated_count)
 
-            response = (
-                f"✅ Recorded order from {order_data.supermarket} with"
-                f" {len(items)} items."
-            )
+        except Exception as e:
+            current_app.logger.error(f"Error recording order: {e}")
+            return f"Error recording order: {str(e)}"
 
-            if updated_count > 0:
-                response += (
-                    f" Updated frequencies for {updated_count} items (had 2+"
-                    " purchases)."
-                )
-            elif len(items) > 0:
-                response += (
-                    " First purchase for these items - I'll start learning patterns"
-                    " after the next purchase."
-                )
 
-            return response
+@grocery_toolset.tool
+async def record_grocery_orders(
+    ctx: RunContext[dict], orders: List[GroceryOrderInput]
+) -> str:
+    """Record several grocery orders at once to learn shopping patterns.
+
+    Use this tool instead of calling record_grocery_order repeatedly when:
+    - User backfills purchase history ("add my last 10 shops")
+    - User provides several receipts or orders in one message
+
+    Orders are recorded oldest first in a single transaction, so either all
+    of them are saved or none are. Each order is handled exactly like
+    record_grocery_order.
+
+    Returns a summary line per recorded order.
+    """
+    current_app.logger.info(
+        f"🔧 TOOL CALLED: record_grocery_orders with {len(orders)} orders"
+    )
+
+    if not orders:
+        return "No orders provided."
+
+    order_dicts = [order_data.model_dump() for order_data in orders]
+
+    # Oldest first so frequencies are learned in purchase order
+    order_dicts.sort(key=lambda order: order["order_date"] or date.today())
+
+    db = current_app.extensions["database"]
+    async with db.session_factory() as session:
+        try:
+            results = await grocery_service.record_orders(session, order_dicts)
+            return "\n".join(
+                _format_order_summary(order, updated_count)
+                for order, (_, updated_count) in zip(order_dicts, results)
+            )
 
         except Exception as e:
-            current_app.logger.error(f"Error recording order: {e}")
-            return f"Error recording order: {str(e)}"
+            current_app.logger.error(f"Error recording orders: {e}")
+            return f"Error recording orders: {str(e)}"
 
 
 @grocery_toolset.tool
@@ -192,34 +285,10 @@ async def get_shopping_predictions(
                 )
 
             # Format predictions
-            lines = ["📋 Shopping Predictions:\n"]
-
-            for i, pred in enumerate(predictions, 1):
-                # Item name with confidence
-                confidence = pred["priority_score"]
-                lines.append(f"{i}. **{pred['item_name']}** (Confidence: {confidence})")
-
-                # Quantity
-                if pred["quantity"] and pred["unit_type"]:
-                    lines.append(
-                        f"   - Quantity: {pred['quantity']} {pred['unit_type']}"
-                    )
-                elif pred["quantity"]:
-                    lines.append(f"   - Quantity: {pred['quantity']}")
-
-                # Reason
-                lines.append(f"   - {pred['reason']}")
-
-                # Urgent flag
-                if pred["is_urgent"]:
-                    urgency_emoji = {"high": "‼️", "normal": "⚠️", "low": "ℹ️"}.get(
-                        pred["urgency_level"], "⚠️"
-                    )
-                    lines.append(f"   - {urgency_emoji} URGENT (on shopping list)")
-
-                lines.append("")  # Blank line between items
-
-            return "\n".join(lines).strip()
+            body = "\n\n".join(
+                _format_prediction(i, pred) for i, pred in enumerate(predictions, 1)
+            )
+            return f"📋 Shopping Predictions:\n\n{body}"
 
         except Exception as e:
             current_app.logger.error(f"Error getting predictions: {e}")
@@ -250,13 +319,6 @@ async def add_to_shopping_list(
         f"🔧 TOOL CALLED: add_to_shopping_list for {item_data.item_name}"
     )
 
-    valid_urgency = {"low", "normal", "high"}
-    if item_data.urgency not in valid_urgency:
-        return (
-            f"Error: Invalid urgency '{item_data.urgency}'. Must be one of:"
-            f" {', '.join(valid_urgency)}"
-        )
-
     db = current_app.extensions["database"]
     async with db.session_factory() as session:
         try:
@@ -407,39 +469,17 @@ async def get_shopping_list(ctx: RunContext[dict]) -> str:
     db = current_app.extensions["database"]
     async with db.session_factory() as session:
         try:
-            from src.models.grocery import ShoppingList
-
             entries = await ShoppingList.get_all(session)
 
             if not entries:
                 return "📋 Your shopping list is empty."
 
             # Format response
-            lines = ["📋 Shopping List:\n"]
-
-            for i, entry in enumerate(entries, 1):
-                # Item details
-                item_name = entry.item.name
-
-                lines.append(f"{i}. {item_name}")
-
-                # Quantity if specified
-                if entry.quantity_needed:
-                    if entry.item.unit_type:
-                        lines.append(
-                            "   - Quantity:"
-                            f" {entry.quantity_needed} {entry.item.unit_type}"
-                        )
-                    else:
-                        lines.append(f"   - Quantity: {entry.quantity_needed}")
-
-                # Notes if present
-                if entry.notes:
-                    lines.append(f"   - Note: {entry.notes}")
-
-                lines.append("")  # Blank line
-
-            return "\n".join(lines).strip()
+            body = "\n\n".join(
+                _format_shopping_list_entry(i, entry)
+                for i, entry in enumerate(entries, 1)
+            )
+            return f"📋 Shopping List:\n\n{body}"
 
         except Exception as e:
             current_app.logger.error(f"Error getting shopping list: {e}")
@@ -472,47 +512,41 @@ async def get_item_history(
             session, item_name=item_name, limit=limit
         )
 
-        if not history:
-            return f"No purchase history found for '{item_name}'."
-
-        # Format response
-        lines = [f"📊 Purchase History: {history['item_name']}\n"]
+    if not history:
+        return f"No purchase history found for '{item_name}'."
+
+    # Format response
+    if history["base_frequency"]:
+        base_frequency = f"{history['base_frequency']} days (learned)"
+    else:
+        base_frequency = "Not yet calculated (need 2+ purchases)"
+
+    lines = [
+        f"📊 Purchase History: {history['item_name']}\n",
+        "Frequency Settings:",
+        f"- Base frequency: {base_frequency}",
+        f"- User adjustment: {history['user_adjustment']:+d} days",
+        f"- Effective frequency: {history['effective_frequency']} days\n",
+    ]
 
-        # Frequency settings
-        lines.append("Frequency Settings:")
-        if history["base_frequency"]:
-            lines.append(
-                f"- Base frequency: {history['base_frequency']} days (learned)"
-            )
-        else:
-            lines.append("- Base frequency: Not yet calculated (need 2+ purchases)")
-
-        lines.append(f"- User adjustment: {history['user_adjustment']:+d} days")
-        lines.append(f"- Effective frequency: {history['effective_frequency']} days\n")
-
-        # Recent purchases
-        if history["recent_purchases"]:
-            lines.append(f"Recent Purchases (last {len(history['recent_purchases'])}):")
-            for i, purchase in enumerate(history["recent_purchases"], 1):
-                price_text = ""
-                if purchase["unit_price"]:
-                    price_text = f" @ ${purchase['unit_price']:.2f}"
-
-                lines.append(
-                    f"{i}. {purchase['date']} -"
-                    f" {purchase['quantity']}{price_text} ({purchase['supermarket']})"
-                )
-            lines.append("")
-
-        # Statistics
-        stats = history["statistics"]
-        lines.append("Statistics:")
-        if stats["avg_interval_days"]:
-            lines.append(f"- Average interval: {stats['avg_interval_days']:.1f} days")
-        if stats["avg_quantity"]:
-            lines.append(f"- Average quantity: {stats['avg_quantity']:.1f}")
-        if stats["common_quantity"]:
-            lines.append(f"- Most common quantity: {stats['common_quantity']}")
-        lines.append(f"- Total purchases: {stats['total_purchases']}")
-
-        return "\n".join(lines)
+    # Recent purchases
+    purchases = history["recent_purchases"]
+    if purchases:
+        lines.append(f"Recent Purchases (last {len(purchases)}):")
+        lines.extend(
+            _format_purchase(i, purchase) for i, purchase in enumerate(purchases, 1)
+        )
+        lines.append("")
+
+    # Statistics
+    stats = history["statistics"]
+    lines.append("Statistics:")
+    if stats["avg_interval_days"]:
+        lines.append(f"- Average interval: {stats['avg_interval_days']:.1f} days")
+    if stats["avg_quantity"]:
+        lines.append(f"- Average quantity: {stats['avg_quantity']:.1f}")
+    if stats["common_quantity"]:
+        lines.append(f"- Most common quantity: {stats['common_quantity']}")
+    lines.append(f"- Total purchases: {stats['total_purchases']}")
+
+    return "\n".join(lines)
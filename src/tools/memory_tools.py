@@ -63,7 +63,7 @@ if QDRANT_AVAILABLE:
             return "Memory search is not available at the moment."
 
         # Generate query vectors for semantic search
-        query_vectors = await memory_service.generate_vectors(
+        query_vectors = await memory_service.generate_vectors_batched(
             content=query,
             role="user",  # Role for query doesn't matter much for semantic search
             timestamp=None,  # Current time will be used
@@ -112,5 +112,8 @@ if QDRANT_AVAILABLE:
             timestamp = datetime.fromtimestamp(created_at).strftime("%Y-%m-%d %H:%M")
             result += f"**{i}.** `{timestamp}` **{role}**: {content}\n"
 
-        current_app.logger.info(result)
+        current_app.logger.info(
+            f"memory_search returned {len(memories)} memories ({len(result)} chars)"
+        )
+        current_app.logger.debug(result)
         return result.strip()
@@ -1,14 +1,21 @@
 """Scheduling tools for agent execution."""
 
+import asyncio
+import time
 import uuid
+from datetime import datetime
+from datetime import timedelta
 from typing import Any
 from typing import Dict
+from typing import List
 
 from apscheduler.jobstores.base import JobLookupError
+from pydantic import BaseModel
 from pydantic_ai import RunContext
 from pydantic_ai.toolsets import FunctionToolset
 from quart import current_app
 
+from src.models.schedule_config import OnceSchedule
 from src.models.schedule_config import ScheduleConfig
 from src.models.schedule_config import ScheduleType
 from src.models.schedule_config import schedule_config_to_dict
@@ -17,6 +24,192 @@ from src.models.schedule_config import schedule_config_to_dict
 scheduling_toolset = FunctionToolset()
 
 
+class AutomationSpec(BaseModel):
+    """A single automation to schedule with setup_automations."""
+
+    agent_instructions: str
+    schedule_type: ScheduleType
+    schedule_config: ScheduleConfig
+    interactive: bool = True
+
+
+# Long-form scheduling guidance, returned on demand by scheduling_help instead of
+# being sent with the setup_automation schema on every request
+SCHEDULING_TOOL_HELP = """## Schedule Types: Critical Differences
+
+**"once" (DateTrigger)**: Execute exactly once at a specific moment
+- Purpose: One-time future events
+- Use for: Appointments, deadlines, reminders for specific dates
+- Examples: "Remind me about the meeting tomorrow at 2 PM", "Send birthday wishes on December 25th at 9 AM"
+
+**"cron" (CronTrigger)**: Execute on calendar-based recurring patterns
+- Purpose: Calendar-aligned schedules (think business calendar)
+- Use for: Daily routines, weekly reports, monthly tasks, business hours
+- Examples: "Every Monday at 9 AM", "First day of every month", "Weekdays at 5 PM"
+- ✅ **Can express**: "Every Tuesday", "Daily at 8 AM", "Monthly on the 15th"
+- ❌ **Cannot express**: "Every other Tuesday", "Every 3 days", "Every 72 hours"
+
+**"interval" (IntervalTrigger)**: Execute at fixed time intervals
+- Purpose: Time-duration based repetition from a starting point
+- Use for: Monitoring, polling, any "every X time units" pattern
+- Examples: "Every 2 hours", "Every 30 minutes", "Every 3 days starting now"
+- ✅ **Can express**: "Every other Friday" (start_date + 2 weeks), "Every 72 hours", "Every 3 days"
+- 🎯 **CRITICAL**: Use this for patterns cron cannot handle like "every other week"
+
+## When to Use setup_automation
+
+Use when users request:
+- "Remind me to..." or "Send me..." with timing
+- "Every [time period]..." recurring tasks
+- "At [specific time]..." scheduled tasks
+- Automated reports, summaries, or notifications
+- Background monitoring or polling tasks
+
+## When NOT to Use setup_automation
+
+Don't use for:
+- Immediate tasks ("What's the weather now?")
+- Emergency actions ("Call 911")
+- Complex workflows (break into steps first)
+
+## Examples
+
+    # ONE-TIME: Specific moment (use "once")
+    agent_instructions = "Send me a birthday reminder"
+    schedule_type = "once"
+    schedule_config = OnceSchedule(when="2024-12-25T09:00:00")
+
+    # CALENDAR-BASED: Business routine (use "cron")
+    agent_instructions = "Send morning briefing with calendar and priorities"
+    schedule_type = "cron"
+    schedule_config = CronSchedule(day_of_week="mon-fri", hour=8, minute=30)
+
+    # TIME-INTERVAL: Regular monitoring (use "interval")
+    agent_instructions = "Check system health and alert if issues found"
+    schedule_type = "interval"
+    schedule_config = IntervalSchedule(hours=2)
+
+    # CALENDAR-BASED: Weekly report (use "cron")
+    agent_instructions = "Generate weekly task summary and email it"
+    schedule_type = "cron"
+    schedule_config = CronSchedule(day_of_week="fri", hour=17, minute=0)
+
+    # TIME-INTERVAL: High-frequency updates (use "interval")
+    agent_instructions = "Update dashboard with latest metrics"
+    schedule_type = "interval"
+    schedule_config = IntervalSchedule(minutes=15)
+
+    # ⚠️ CRITICAL EXAMPLE: "Every other Thursday" - MUST use interval, not cron!
+    agent_instructions = "Send bi-weekly team update"
+    schedule_type = "interval"
+    schedule_config = IntervalSchedule(weeks=2, start_date="2025-09-25T10:00:00")
+    # Why interval? Cron cannot express "every other" patterns - only interval can!
+"""
+
+# Config field reported as "scheduled_for", and its fallback, per schedule type
+_SCHEDULED_FOR_FIELDS = {
+    ScheduleType.ONCE: ("when", "unknown"),
+    ScheduleType.CRON: ("when", "unknown"),
+    ScheduleType.INTERVAL: ("start_date", "interval"),
+}
+
+# How far in the past a "once" time may be before it is rejected outright
+_PAST_SCHEDULE_GRACE = timedelta(minutes=5)
+
+# Short-lived cache of the automations_list output, invalidated whenever these
+# tools add or remove a job. Keyed on the scheduler so separate apps never share
+# an entry.
+_automations_cache = {
+    "scheduler": None,
+    "expires": 0.0,
+    "output": None,
+    "generation": 0,
+}
+
+
+def _invalidate_automations_cache():
+    """Force the next automations_list call to read from the scheduler."""
+    _automations_cache["expires"] = 0.0
+    _automations_cache["generation"] += 1
+
+
+def _is_in_past(when, timezone):
+    """Check whether an ISO datetime is more than the grace period ago.
+
+    Naive values are read in the scheduler's timezone. Unparseable values are
+    left for the scheduling service to reject.
+    """
+    try:
+        run_date = datetime.fromisoformat(when)
+    except ValueError:
+        return False
+    now = datetime.now(timezone)
+    if run_date.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return run_date < now - _PAST_SCHEDULE_GRACE
+
+
+def _past_once_error(schedule_type, schedule_config, timezone):
+    """Return an error result if a "once" time has already passed, else None."""
+    # A past "once" time would only be stored and then misfire, so reject it here
+    if isinstance(schedule_config, OnceSchedule) and _is_in_past(
+        schedule_config.when, timezone
+    ):
+        return {
+            "status": "error",
+            "message": f"Scheduled time {schedule_config.when} is in the past",
+            "type": schedule_type.value,
+        }
+    return None
+
+
+def _new_task(ctx, agent_instructions, schedule_type, schedule_config, interactive):
+    """Build the scheduling service arguments for a new automation."""
+    return {
+        "task_id": uuid.uuid4().hex,
+        "conversation_id": ctx.deps.get("conversation_id"),
+        "agent_instructions": agent_instructions,
+        "schedule_type": schedule_type.value,
+        "schedule_config": schedule_config_to_dict(schedule_config),
+        "interactive": interactive,
+        "max_retries": 3,
+    }
+
+
+def _scheduled_result(task, job_id, created):
+    """Build the tool result for a new or already scheduled automation."""
+    schedule_type = ScheduleType(task["schedule_type"])
+    field, fallback = _SCHEDULED_FOR_FIELDS[schedule_type]
+    if created:
+        task_id = task["task_id"]
+        message = f"Task scheduled successfully with job ID: {job_id}"
+    else:
+        task_id = job_id
+        message = f"An identical task is already scheduled with job ID: {job_id}"
+    return {
+        "status": "success",
+        "job_id": job_id,
+        "task_id": task_id,
+        "message": message,
+        "scheduled_for": task["schedule_config"].get(field) or fallback,
+        "type": schedule_type.value,
+    }
+
+
+def _format_run_time(run_time):
+    """Format a job's next run time to the second; paused jobs have none."""
+    return run_time.isoformat(timespec="seconds") if run_time else "N/A"
+
+
+def _read_jobs(scheduler):
+    """Fetch all jobs and return their formatted listing, empty if there are none."""
+    return "\n".join(
+        f"{job.id} - {job.name}, trigger: {job.trigger}, next run at:"
+        f" {_format_run_time(job.next_run_time)}"
+        for job in scheduler.get_jobs()
+    )
+
+
 @scheduling_toolset.tool
 async def setup_automation(
     ctx: RunContext[Dict[str, Any]],
@@ -28,124 +221,99 @@ async def setup_automation(
     """Schedule automated agent tasks using three distinct timing approaches.
 
     Use this tool to set up automated execution of agent tasks at specific times or recurring intervals.
-    The key is choosing the right schedule type for your timing pattern.
+    Call scheduling_help for when (not) to schedule and worked examples.
 
     ## Quick Decision Guide
 
-    Ask yourself: "When should this task run?"
-
-    - **One specific time** → Use "once"
-    - **Calendar pattern** (daily, weekly, monthly) → Use "cron"
-    - **Time interval pattern** (every X hours/days) → Use "interval"
+    - **One specific time** → "once" with OnceSchedule(when=ISO datetime)
+    - **Calendar pattern** (daily, weekly, monthly) → "cron" with CronSchedule
+    - **Time interval pattern** (every X hours/days) → "interval" with IntervalSchedule
 
-    ## Schedule Types: Critical Differences
+    Cron cannot express "every other" or "every N days" patterns. Use interval
+    with a start_date instead, e.g. every other Thursday is
+    IntervalSchedule(weeks=2, start_date="2025-09-25T10:00:00").
 
-    **"once" (DateTrigger)**: Execute exactly once at a specific moment
-    - Purpose: One-time future events
-    - Use for: Appointments, deadlines, reminders for specific dates
-    - Examples: "Remind me about the meeting tomorrow at 2 PM", "Send birthday wishes on December 25th at 9 AM"
+    Returns:
+        Dictionary with task details including job_id, status, and next run time,
+        or status "error" and a message if a "once" time has already passed
 
-    **"cron" (CronTrigger)**: Execute on calendar-based recurring patterns
-    - Purpose: Calendar-aligned schedules (think business calendar)
-    - Use for: Daily routines, weekly reports, monthly tasks, business hours
-    - Examples: "Every Monday at 9 AM", "First day of every month", "Weekdays at 5 PM"
-    - ✅ **Can express**: "Every Tuesday", "Daily at 8 AM", "Monthly on the 15th"
-    - ❌ **Cannot express**: "Every other Tuesday", "Every 3 days", "Every 72 hours"
+    """
+    scheduling_service = current_app.extensions["scheduling"]
+    error = _past_once_error(
+        schedule_type, schedule_config, scheduling_service.scheduler.timezone
+    )
+    if error is not None:
+        return error
 
-    **"interval" (IntervalTrigger)**: Execute at fixed time intervals
-    - Purpose: Time-duration based repetition from a starting point
-    - Use for: Monitoring, polling, any "every X time units" pattern
-    - Examples: "Every 2 hours", "Every 30 minutes", "Every 3 days starting now"
-    - ✅ **Can express**: "Every other Friday" (start_date + 2 weeks), "Every 72 hours", "Every 3 days"
-    - 🎯 **CRITICAL**: Use this for patterns cron cannot handle like "every other week"
+    task = _new_task(
+        ctx, agent_instructions, schedule_type, schedule_config, interactive
+    )
 
-    ## When to Use This Tool
+    # Schedule the task, or return the existing one if it is already scheduled
+    job_id, created = await scheduling_service.schedule_unless_duplicate(**task)
+    if created:
+        _invalidate_automations_cache()
+    return _scheduled_result(task, job_id, created)
 
-    Use when users request:
-    - "Remind me to..." or "Send me..." with timing
-    - "Every [time period]..." recurring tasks
-    - "At [specific time]..." scheduled tasks
-    - Automated reports, summaries, or notifications
-    - Background monitoring or polling tasks
 
-    ## When NOT to Use This Tool
+@scheduling_toolset.tool
+async def setup_automations(
+    ctx: RunContext[Dict[str, Any]], automations: List[AutomationSpec]
+) -> List[Dict[str, Any]]:
+    """Schedule several automated agent tasks at once.
 
-    Don't use for:
-    - Immediate tasks ("What's the weather now?")
-    - Emergency actions ("Call 911")
-    - Complex workflows (break into steps first)
+    Use this tool instead of calling setup_automation repeatedly when the user asks
+    for more than one automation in a single message ("remind me to stretch every
+    hour and send a weekly summary on Fridays").
 
-    Examples:
-        # ONE-TIME: Specific moment (use "once")
-        agent_instructions = "Send me a birthday reminder"
-        schedule_type = "once"
-        schedule_config = OnceSchedule(when="2024-12-25T09:00:00")
-
-        # CALENDAR-BASED: Business routine (use "cron")
-        agent_instructions = "Send morning briefing with calendar and priorities"
-        schedule_type = "cron"
-        schedule_config = CronSchedule(day_of_week="mon-fri", hour=8, minute=30)
-
-        # TIME-INTERVAL: Regular monitoring (use "interval")
-        agent_instructions = "Check system health and alert if issues found"
-        schedule_type = "interval"
-        schedule_config = IntervalSchedule(hours=2)
-
-        # CALENDAR-BASED: Weekly report (use "cron")
-        agent_instructions = "Generate weekly task summary and email it"
-        schedule_type = "cron"
-        schedule_config = CronSchedule(day_of_week="fri", hour=17, minute=0)
-
-        # TIME-INTERVAL: High-frequency updates (use "interval")
-        agent_instructions = "Update dashboard with latest metrics"
-        schedule_type = "interval"
-        schedule_config = IntervalSchedule(minutes=15)
-
-        # ⚠️ CRITICAL EXAMPLE: "Every other Thursday" - MUST use interval, not cron!
-        agent_instructions = "Send bi-weekly team update"
-        schedule_type = "interval"
-        schedule_config = IntervalSchedule(weeks=2, start_date="2025-09-25T10:00:00")
-        # Why interval? Cron cannot express "every other" patterns - only interval can!
+    Each automation is handled exactly like setup_automation, and their task
+    records are stored together in a single transaction. Identical automations
+    in one call are only scheduled once.
 
     Returns:
-        Dictionary with task details including job_id, status, and next run time
-
+        One setup_automation result dictionary per automation, in the same order
     """
-    # Get conversation ID from context
-    conversation_id = ctx.deps.get("conversation_id")
-
-    # Generate unique task ID
-    task_id = str(uuid.uuid4())
-
-    # Convert Pydantic model to dict
-    schedule_config_dict = schedule_config_to_dict(schedule_config)
-
-    # Schedule the task
+    current_app.logger.info(
+        f"🔧 TOOL CALLED: setup_automations with {len(automations)} automations"
+    )
     scheduling_service = current_app.extensions["scheduling"]
-    job_id = await scheduling_service.schedule_agent_execution(
-        task_id=task_id,
-        conversation_id=conversation_id,
-        agent_instructions=agent_instructions,
-        schedule_type=schedule_type.value,
-        schedule_config=schedule_config_dict,
-        interactive=interactive,
-        max_retries=3,
+    timezone = scheduling_service.scheduler.timezone
+
+    results = [
+        _past_once_error(spec.schedule_type, spec.schedule_config, timezone)
+        for spec in automations
+    ]
+    tasks = {
+        i: _new_task(
+            ctx,
+            spec.agent_instructions,
+            spec.schedule_type,
+            spec.schedule_config,
+            spec.interactive,
+        )
+        for i, spec in enumerate(automations)
+        if results[i] is None
+    }
+
+    outcomes = await scheduling_service.schedule_many_unless_duplicate(
+        list(tasks.values())
     )
+    if any(created for _, created in outcomes):
+        _invalidate_automations_cache()
+    for (i, task), (job_id, created) in zip(tasks.items(), outcomes):
+        results[i] = _scheduled_result(task, job_id, created)
+    return results
 
-    # Determine scheduled_for based on type
-    if schedule_type == ScheduleType.INTERVAL:
-        scheduled_for = getattr(schedule_config, "start_date", None) or "interval"
-    else:
-        scheduled_for = getattr(schedule_config, "when", "unknown")
 
-    return {
-        "status": "success",
-        "job_id": job_id,
-        "task_id": task_id,
-        "message": f"Task scheduled successfully with job ID: {job_id}",
-        "scheduled_for": scheduled_for,
-        "type": schedule_type.value,
-    }
+@scheduling_toolset.tool
+async def scheduling_help(ctx: RunContext[Dict[str, Any]]) -> str:
+    """Get detailed guidance and examples for choosing a setup_automation schedule.
+
+    Use this tool before setup_automation when unsure which schedule type fits
+    the user's request.
+    """
+    current_app.logger.info("🔧 TOOL CALLED: scheduling_help")
+    return SCHEDULING_TOOL_HELP
 
 
 @scheduling_toolset.tool
@@ -167,22 +335,32 @@ async def automations_list(ctx: RunContext[Dict[str, Any]]) -> str:
     """
     current_app.logger.info("🔧 TOOL CALLED: automations_list")
 
-    # Get jobs from APScheduler and capture the output
-    scheduling_service = current_app.extensions["scheduling"]
-    jobs = scheduling_service.scheduler.get_jobs()
+    scheduler = current_app.extensions["scheduling"].scheduler
+    if (
+        _automations_cache["scheduler"] is scheduler
+        and time.monotonic() < _automations_cache["expires"]
+    ):
+        return _automations_cache["output"]
 
-    if not jobs:
-        current_app.logger.info("No jobs are currently scheduled.")
-        return "No jobs are currently scheduled."
+    # Reading the jobstore unpickles every job, so keep it off the event loop
+    now = time.monotonic()
+    generation = _automations_cache["generation"]
+    output = await asyncio.to_thread(_read_jobs, scheduler)
 
-    output = []
-    for job in jobs:
-        output.append(
-            f"{job.id} - {job.name}, trigger: {job.trigger}, next run at:"
-            f" {job.next_run_time}"
+    if not output:
+        current_app.logger.info("No jobs are currently scheduled.")
+        output = "No jobs are currently scheduled."
+    else:
+        current_app.logger.debug(output)
+
+    # A job added or removed during the read may be missing from this result
+    if _automations_cache["generation"] == generation:
+        _automations_cache.update(
+            scheduler=scheduler,
+            expires=now + current_app.config.get("AUTOMATIONS_LIST_CACHE_TTL", 3.0),
+            output=output,
         )
-    current_app.logger.debug("\n".join(output))
-    return "\n".join(output)
+    return output
 
 
 @scheduling_toolset.tool
@@ -198,12 +376,13 @@ async def delete_automation(ctx: RunContext[Dict[str, Any]], task_id: str) -> st
 
     Examples:
         # Delete a specific automation by its ID
-        delete_automation(task_id="123e4567-e89b-12d3-a456-426614174000")
+        delete_automation(task_id="123e4567e89b12d3a456426614174000")
     """
     current_app.logger.info(f"🔧 TOOL CALLED: delete_automation with task_id={task_id}")
     scheduling_service = current_app.extensions["scheduling"]
     try:
         scheduling_service.scheduler.remove_job(task_id)
+        _invalidate_automations_cache()
         return f"Task with ID {task_id} deleted successfully"
     except JobLookupError:
         return f"Task with ID {task_id} not found or could not be deleted"
@@ -1,5 +1,6 @@
 """Todo management tools for agent."""
 
+import base64
 import secrets
 from typing import Dict
 from typing import List
@@ -11,6 +12,9 @@ from quart import current_app
 # Create toolset for todo tools
 todo_toolset = FunctionToolset()
 
+_STATUS_EMOJI = {"pending": "⏳", "in_progress": "🔄", "completed": "✅"}
+_DEFAULT_STATUS_EMOJI = "❓"
+
 
 @todo_toolset.tool
 async def todo_read(ctx: RunContext[dict]) -> str:
@@ -41,19 +45,15 @@ async def todo_read(ctx: RunContext[dict]) -> str:
     if not todos:
         return "No todos found for this conversation."
 
-    result = f"Current todos ({len(todos)} total):\n"
+    lines = [f"Current todos ({len(todos)} total):"]
     for i, todo in enumerate(todos, 1):
-        status_emoji = {
-            "pending": "⏳",
-            "in_progress": "🔄",
-            "completed": "✅",
-        }.get(todo["state"], "❓")
-        result += (
+        status_emoji = _STATUS_EMOJI.get(todo["state"], _DEFAULT_STATUS_EMOJI)
+        lines.append(
             f"{i}. [{todo['state']}] {status_emoji} {todo['description']} (ID:"
-            f" {todo['id']})\n"
+            f" {todo['id']})"
         )
 
-    return result.strip()
+    return "\n".join(lines)
 
 
 @todo_toolset.tool
@@ -195,49 +195,43 @@ async def todo_write(  # noqa: C901
     if not tasks:
         return "No tasks provided."
 
-    # Validate only one task can be in_progress
-    in_progress_count = sum(1 for task in tasks if task.get("state") == "in_progress")
-    if in_progress_count > 1:
-        return "Error: Only one task can have 'in_progress' state at a time."
-
-    # Validate required fields and states
+    # Validate and build todos in a single pass
     valid_states = {"pending", "in_progress", "completed"}
-    for task in tasks:
-        if not isinstance(task, dict):
+    new_todos = []
+    state_counts = {}
+    # Draw the random bytes for every todo ID at once, 6 bytes (8 chars) each
+    id_bytes = secrets.token_bytes(6 * len(tasks))
+    for i, task_data in enumerate(tasks):
+        if not isinstance(task_data, dict):
             return "Error: Each task must be a dictionary."
-        if "description" not in task or "state" not in task:
+        if "description" not in task_data or "state" not in task_data:
             return "Error: Each task must have 'description' and 'state' fields."
-        if task["state"] not in valid_states:
+        state = task_data["state"]
+        if state not in valid_states:
             return (
-                f"Error: Invalid state '{task['state']}'. Must be one of:"
+                f"Error: Invalid state '{state}'. Must be one of:"
                 f" {', '.join(valid_states)}"
             )
+        state_counts[state] = state_counts.get(state, 0) + 1
+        if state == "in_progress" and state_counts[state] > 1:
+            return "Error: Only one task can have 'in_progress' state at a time."
 
-    # Generate simple IDs and create todos
-    new_todos = []
-    for task_data in tasks:
-        todo = {
-            "id": secrets.token_urlsafe(6),
+        # Generate a simple ID and create the todo
+        new_todos.append({
+            "id": base64.urlsafe_b64encode(id_bytes[i * 6 : i * 6 + 6]).decode(),
             "description": task_data["description"],
-            "state": task_data["state"],
-        }
-        new_todos.append(todo)
+            "state": state,
+        })
 
     # Set todos on conversation (automatically broadcasts status update)
     await conversation.set_todos(new_todos)
 
     # Return summary
-    state_counts = {}
-    for todo in new_todos:
-        state = todo["state"]
-        state_counts[state] = state_counts.get(state, 0) + 1
-
     summary = f"Updated todos: {len(new_todos)} total"
     if state_counts:
         parts = []
         for state, count in state_counts.items():
-            emoji = {"pending": "⏳", "in_progress": "🔄", "completed": "✅"}[state]
-            parts.append(f"{count} {state} {emoji}")
+            parts.append(f"{count} {state} {_STATUS_EMOJI[state]}")
         summary += f" ({', '.join(parts)})"
 
     return summary
@@ -0,0 +1,14 @@
+"""Shared test doubles."""
+
+
+class FakeSessionCtx:
+    """Async context manager standing in for a database session factory call."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *exc_info):
+        return None
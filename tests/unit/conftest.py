@@ -1,5 +1,6 @@
 """Fixtures for unit tests that don't require database dependencies."""
 
+from datetime import timezone
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pytest
 import pytest_asyncio
 
 from src import create_app
+from tests.helpers import FakeSessionCtx
 
 
 @pytest_asyncio.fixture
@@ -36,16 +38,16 @@ async def app():
         mock_db = MagicMock()
 
         # Create a proper async context manager for session factory
-        mock_session = AsyncMock()
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_context.__aexit__ = AsyncMock(return_value=None)
-        mock_session_factory = MagicMock(return_value=mock_session_context)
+        mock_session_factory = MagicMock(return_value=FakeSessionCtx(AsyncMock()))
         mock_db.session_factory = mock_session_factory
 
         # Mock scheduling service
         mock_scheduling = MagicMock()
         mock_scheduling.schedule_agent_execution = AsyncMock()
+        mock_scheduling.scheduler.timezone = timezone.utc
+        mock_scheduling.schedule_unless_duplicate = AsyncMock(
+            side_effect=lambda task_id, **kwargs: (task_id, True)
+        )
 
         app.extensions["database"] = mock_db
         app.extensions["user_manager"] = MagicMock()
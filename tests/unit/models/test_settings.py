@@ -6,13 +6,23 @@ from pydantic import ValidationError
 from src.models.settings import Settings
 
 
+def _make(**kwargs):
+    """Build Settings without validation, for tests of logic beyond validation."""
+    return Settings.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Settings holding only field defaults, shared by read-only tests."""
+    return Settings.model_construct()
+
+
 class TestSettingsDefaults:
     """Test Settings model default values."""
 
-    def test_settings_has_sensible_defaults(self):
+    def test_settings_has_sensible_defaults(self, default_settings):
         """Test that Settings can be created with defaults only."""
-        # Use model_construct to bypass validation for this test
-        settings = Settings.model_construct()
+        settings = default_settings
 
         # LLM defaults
         assert settings.llm_provider == "zen"
@@ -37,10 +47,11 @@ class TestSettingsDefaults:
         assert settings.assistance_link_expiration == 300
         assert settings.debug is False
         assert settings.log_level == "INFO"
+        assert settings.automations_list_cache_ttl == 3.0
 
-    def test_optional_fields_default_to_none(self):
+    def test_optional_fields_default_to_none(self, default_settings):
         """Test that optional fields default to None."""
-        settings = Settings.model_construct()
+        settings = default_settings
 
         assert settings.openrouter_api_key is None
         assert settings.zen_api_key is None
@@ -173,7 +184,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_openrouter_required_fields(self):
         """Test required fields when using OpenRouter."""
-        settings = Settings(
+        settings = _make(
             llm_provider="openrouter",
             openrouter_api_key="test-key",
         )
@@ -183,7 +194,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_zen_required_fields(self):
         """Test required fields when using Zen."""
-        settings = Settings(
+        settings = _make(
             llm_provider="zen",
             zen_api_key="test-key",
         )
@@ -193,7 +204,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_telegram_requires_webhook_when_token_set(self):
         """Test that setting telegram_bot_token adds webhook to required fields."""
-        settings = Settings(
+        settings = _make(
             llm_provider="zen",
             zen_api_key="test-key",
             telegram_bot_token="bot-token",
@@ -204,7 +215,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_telegram_no_requirements_when_not_configured(self):
         """Test that telegram fields are not required when not configured."""
-        settings = Settings(
+        settings = _make(
             llm_provider="zen",
             zen_api_key="test-key",
         )
@@ -214,7 +225,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_qdrant_requires_api_key_when_host_set(self):
         """Test that setting qdrant_host adds api_key to required fields."""
-        settings = Settings(
+        settings = _make(
             llm_provider="zen",
             zen_api_key="test-key",
             qdrant_host="localhost",
@@ -225,7 +236,7 @@ class TestSettingsRequiredFieldsLogic:
 
     def test_qdrant_no_requirements_when_not_configured(self):
         """Test that qdrant fields are not required when not configured."""
-        settings = Settings(
+        settings = _make(
             llm_provider="zen",
             zen_api_key="test-key",
         )
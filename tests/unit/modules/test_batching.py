@@ -0,0 +1,77 @@
+"""Unit tests for the batch coalescer."""
+
+import asyncio
+
+import pytest
+
+from src.modules.batching import BatchCoalescer
+
+
+class TestBatchCoalescer:
+    """Test how BatchCoalescer groups submissions."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_a_batch(self):
+        """Items submitted together reach the handler in one call, in order."""
+        batches = []
+
+        async def handler(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        coalescer = BatchCoalescer(handler)
+        results = await asyncio.gather(*[coalescer.submit(i) for i in range(3)])
+
+        assert results == [0, 2, 4]
+        assert batches == [[0, 1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_submissions_during_a_flush_form_the_next_batch(self):
+        """A lone item is flushed straight away; later ones wait for it."""
+        batches = []
+        release = asyncio.Event()
+
+        async def handler(items):
+            batches.append(items)
+            await release.wait()
+            return items
+
+        coalescer = BatchCoalescer(handler)
+        first = coalescer.submit("a")
+        await asyncio.sleep(0)
+        assert batches == [["a"]]
+
+        rest = [coalescer.submit("b"), coalescer.submit("c")]
+        release.set()
+
+        assert await asyncio.gather(first, *rest) == ["a", "b", "c"]
+        assert batches == [["a"], ["b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_returned_exception_fails_only_its_item(self):
+        """Per-item exceptions are raised to their own submitter only."""
+
+        async def handler(items):
+            return [ValueError(item) if item == "bad" else item for item in items]
+
+        coalescer = BatchCoalescer(handler)
+        good, bad = await asyncio.gather(
+            coalescer.submit("good"), coalescer.submit("bad"), return_exceptions=True
+        )
+
+        assert good == "good"
+        assert isinstance(bad, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_raised_exception_fails_the_batch(self):
+        """A handler error is raised to every submitter in the batch."""
+
+        async def handler(items):
+            raise RuntimeError("unavailable")
+
+        coalescer = BatchCoalescer(handler)
+        results = await asyncio.gather(
+            coalescer.submit(1), coalescer.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
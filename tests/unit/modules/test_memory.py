@@ -29,6 +29,9 @@ def mock_vector_generator():
         }
 
     mock_gen.generate_all = sync_generate_all
+    mock_gen.generate_all_batch = lambda requests: [
+        sync_generate_all(**request) for request in requests
+    ]
 
     return mock_gen
 
@@ -360,6 +363,27 @@ class TestMemoryStorage:
         }
         assert vectors == expected_vectors
 
+    @pytest.mark.asyncio
+    async def test_generate_vectors_batched(self, memory_system, mock_vector_generator):
+        """Test that concurrent batched vector requests share one batch call."""
+        calls = []
+        batch_generate = mock_vector_generator.generate_all_batch
+
+        def record_batch(requests):
+            calls.append([request["content"] for request in requests])
+            return batch_generate(requests)
+
+        mock_vector_generator.generate_all_batch = record_batch
+
+        results = await asyncio.gather(
+            memory_system.generate_vectors_batched(content="first", role="user"),
+            memory_system.generate_vectors_batched(content="second", role="user"),
+        )
+
+        assert calls == [["first", "second"]]
+        assert len(results) == 2
+        assert results[0]["semantic"] == [0.1] * 384
+
     def test_emotional_charge_calculation(self, memory_system, mock_sentiment_analyzer):
         """Test emotional charge calculation."""
         # Test positive compound score
@@ -0,0 +1,64 @@
+"""Unit tests for the vector generators."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.modules.vector_generator import SemanticVectorGenerator
+
+
+@pytest.fixture
+def fallback_generator():
+    """Semantic generator using the word frequency fallback embedding."""
+    generator = SemanticVectorGenerator.__new__(SemanticVectorGenerator)
+    generator.vector_size = 384
+    generator.model = None
+    generator.use_fastembed = False
+    return generator
+
+
+@pytest.fixture
+def fastembed_generator():
+    """Semantic generator whose model embeds each text as a distinct vector."""
+    generator = SemanticVectorGenerator.__new__(SemanticVectorGenerator)
+    generator.vector_size = 384
+    generator.model = MagicMock()
+    generator.model.embed.side_effect = lambda texts: (
+        MagicMock(**{"tolist.return_value": [float(len(text))] * 384}) for text in texts
+    )
+    generator.use_fastembed = True
+    return generator
+
+
+class TestSemanticGenerateBatch:
+    """Test SemanticVectorGenerator.generate_batch against generate."""
+
+    TEXTS = ["The cat sat", "", "Dogs bark loudly", "   ", "cat"]
+
+    def test_fallback_batch_matches_generate(self, fallback_generator):
+        """Each batch vector equals the single-text vector, in input order."""
+        batch = fallback_generator.generate_batch(self.TEXTS)
+
+        assert batch == [fallback_generator.generate(text) for text in self.TEXTS]
+
+    def test_fastembed_batch_matches_generate(self, fastembed_generator):
+        """The model path keeps input order and only embeds non-blank texts."""
+        batch = fastembed_generator.generate_batch(self.TEXTS)
+
+        fastembed_generator.model.embed.assert_called_once_with([
+            "The cat sat",
+            "Dogs bark loudly",
+            "cat",
+        ])
+        assert batch == [fastembed_generator.generate(text) for text in self.TEXTS]
+
+    def test_blank_texts_give_zero_vectors(self, fastembed_generator):
+        """Empty and whitespace-only texts give zero vectors without the model."""
+        batch = fastembed_generator.generate_batch(["", "  \n"])
+
+        assert batch == [[0.0] * 384, [0.0] * 384]
+        fastembed_generator.model.embed.assert_not_called()
+
+    def test_empty_batch(self, fallback_generator):
+        """An empty input list gives an empty result."""
+        assert fallback_generator.generate_batch([]) == []
@@ -44,7 +44,14 @@ class TestFormGeneration:
     def test_form_excludes_hidden_fields(self, app):
         """Test that internal/hidden fields are excluded from form."""
         # Fields that should be excluded
-        excluded = {"debug", "log_level", "secret_key", "database_name", "data_dir"}
+        excluded = {
+            "debug",
+            "log_level",
+            "secret_key",
+            "database_name",
+            "data_dir",
+            "automations_list_cache_ttl",
+        }
 
         for field_name in excluded:
             assert not hasattr(
@@ -346,3 +346,60 @@ async def test_get_item_history(test_db):
         assert len(history["recent_purchases"]) == 3
         assert history["statistics"]["total_purchases"] == 3
         assert history["base_frequency"] == 7  # Median of [7, 7]
+
+        # A zero limit still finds the item, with no purchases listed
+        history = await grocery_service.get_item_history(
+            session, item_name=item_name, limit=0
+        )
+        assert history is not None
+        assert history["item_name"] == "Eggs"
+        assert history["recent_purchases"] == []
+
+
+@pytest.mark.asyncio
+async def test_add_to_shopping_list_attaches_item(test_db):
+    """Test that the returned shopping list entry has its item loaded."""
+    async with test_db() as session:
+        entry, item_name = await grocery_service.add_to_shopping_list(
+            session, item_name="butter"
+        )
+        assert entry.item.name == item_name == "Butter"
+
+        updated, _ = await grocery_service.add_to_shopping_list(
+            session, item_name="Butter", urgency="high"
+        )
+        assert updated.id == entry.id
+        assert updated.item.name == "Butter"
+
+
+@pytest.mark.asyncio
+async def test_record_orders_batch(test_db):
+    """Test recording several orders in one transaction."""
+    async with test_db() as session:
+        await grocery_service.add_to_shopping_list(session, item_name="Milk")
+
+        results = await grocery_service.record_orders(
+            session,
+            [
+                {
+                    "supermarket": "Tesco",
+                    "items": [{"name": "Milk", "quantity": 2.0}],
+                    "order_date": date.today() - timedelta(days=14),
+                },
+                {
+                    "supermarket": "Tesco",
+                    "items": [
+                        {"name": "Milk", "quantity": 2.0},
+                        {"name": "Bread", "quantity": 1.0},
+                    ],
+                    "order_date": date.today() - timedelta(days=7),
+                },
+            ],
+        )
+
+        assert [updated for _, updated in results] == [0, 1]
+
+        milk = await GroceryItem.get_by_name(session, "Milk")
+        assert milk.base_frequency_days == 7
+        assert milk.last_purchased_date == date.today() - timedelta(days=7)
+        assert await ShoppingList.get_by_item(session, milk.id) is None
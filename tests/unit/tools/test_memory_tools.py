@@ -27,6 +27,9 @@ def mock_vector_generator():
         }
 
     mock_gen.generate_all = sync_generate_all
+    mock_gen.generate_all_batch = lambda requests: [
+        sync_generate_all(**request) for request in requests
+    ]
     return mock_gen
 
 
@@ -4,6 +4,7 @@ import os
 import tempfile
 import uuid
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -56,6 +57,7 @@ class TestSchedulingToolsIntegration:
                         job_id VARCHAR(255) NOT NULL UNIQUE,
                         conversation_id VARCHAR(36) NOT NULL,
                         agent_instructions TEXT NOT NULL,
+                        schedule_type VARCHAR(20) NOT NULL,
                         schedule_config TEXT NOT NULL,
                         status VARCHAR(50) NOT NULL DEFAULT 'pending',
                         failure_count INTEGER NOT NULL DEFAULT 0,
@@ -150,3 +152,325 @@ class TestSchedulingToolsIntegration:
         ctx = MagicMock(spec=RunContext)
         ctx.deps = {"conversation_id": conversation_id}
         return ctx, conversation_id
+
+    @pytest.mark.asyncio
+    async def test_automations_list_cache_invalidated(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """Listing is cached until a tool adds or removes a job."""
+        from src.models.schedule_config import CronSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.tools.scheduling_tools import automations_list
+        from src.tools.scheduling_tools import delete_automation
+        from src.tools.scheduling_tools import setup_automation
+
+        ctx, conversation_id = mock_run_context
+        ctx.deps = {"conversation_id": str(conversation_id)}
+        scheduler = mock_app_with_real_db.extensions["scheduling"].scheduler
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+        ):
+            assert await automations_list(ctx) == "No jobs are currently scheduled."
+
+            result = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Water the plants",
+                schedule_type=ScheduleType.CRON,
+                schedule_config=CronSchedule(hour=8, minute=0),
+            )
+            listing = await automations_list(ctx)
+            assert result["job_id"] in listing
+
+            # A repeat call within the TTL reuses the cached output
+            with patch.object(scheduler, "get_jobs") as get_jobs:
+                assert await automations_list(ctx) == listing
+                get_jobs.assert_not_called()
+
+            # Unknown IDs are reported as not found and leave the cache intact
+            message = await delete_automation(ctx, "missing")
+            assert "not found" in message
+            with patch.object(scheduler, "get_jobs") as get_jobs:
+                assert await automations_list(ctx) == listing
+                get_jobs.assert_not_called()
+
+            # A job added behind the cache's back is still deleted
+            scheduler.add_job(print, "interval", hours=1, id="external")
+            message = await delete_automation(ctx, "external")
+            assert "deleted successfully" in message
+            assert scheduler.get_job("external") is None
+
+            await delete_automation(ctx, result["job_id"])
+            assert await automations_list(ctx) == "No jobs are currently scheduled."
+
+    @pytest.mark.asyncio
+    async def test_setup_automations_batches_tasks(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """Several automations share one commit, written before their jobs."""
+        from src.models.schedule_config import CronSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.models.scheduled_task import ScheduledTask
+        from src.tools.scheduling_tools import AutomationSpec
+        from src.tools.scheduling_tools import setup_automations
+
+        ctx, conversation_id = mock_run_context
+        ctx.deps = {"conversation_id": str(conversation_id)}
+        db_service = mock_app_with_real_db.extensions["database"]
+        scheduler = mock_app_with_real_db.extensions["scheduling"].scheduler
+        create_tasks = ScheduledTask.create_tasks
+
+        async def create_tasks_before_jobs(session, tasks):
+            assert not scheduler.get_jobs()
+            return await create_tasks(session, tasks)
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+            patch.object(
+                ScheduledTask, "create_tasks", side_effect=create_tasks_before_jobs
+            ) as create_tasks_mock,
+        ):
+            results = await setup_automations(
+                ctx,
+                [
+                    AutomationSpec(
+                        agent_instructions=f"Reminder {i}",
+                        schedule_type=ScheduleType.CRON,
+                        schedule_config=CronSchedule(hour=9, minute=i),
+                    )
+                    for i in range(3)
+                ],
+            )
+
+        create_tasks_mock.assert_called_once()
+        assert [result["status"] for result in results] == ["success"] * 3
+        assert len(scheduler.get_jobs()) == 3
+        async with db_service.session_factory() as session:
+            for i, result in enumerate(results):
+                task = await ScheduledTask.get_by_id(session, result["task_id"])
+                assert task is not None
+                assert task.agent_instructions == f"Reminder {i}"
+
+    @pytest.mark.asyncio
+    async def test_setup_automations_schedules_repeated_spec_once(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """The same automation submitted twice in one call yields one job."""
+        from src.models.schedule_config import CronSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.tools.scheduling_tools import AutomationSpec
+        from src.tools.scheduling_tools import setup_automations
+
+        ctx, conversation_id = mock_run_context
+        ctx.deps = {"conversation_id": str(conversation_id)}
+        scheduler = mock_app_with_real_db.extensions["scheduling"].scheduler
+        spec = AutomationSpec(
+            agent_instructions="Stretch",
+            schedule_type=ScheduleType.CRON,
+            schedule_config=CronSchedule(hour=10, minute=0),
+        )
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+        ):
+            results = await setup_automations(ctx, [spec, spec])
+
+        assert results[0]["job_id"] == results[1]["job_id"]
+        assert len(scheduler.get_jobs()) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_write_retries_tasks_individually(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """One bad record fails only its own caller and never gets a job."""
+        import asyncio
+
+        from src.models.scheduled_task import ScheduledTask
+
+        _, conversation_id = mock_run_context
+        scheduling_service = mock_app_with_real_db.extensions["scheduling"]
+        db_service = mock_app_with_real_db.extensions["database"]
+        create_task = ScheduledTask.create_task
+
+        async def create_task_or_fail(session, **task):
+            if task["agent_instructions"] == "Bad":
+                raise ValueError("bad record")
+            return await create_task(session, **task)
+
+        with (
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+            patch.object(
+                ScheduledTask, "create_tasks", side_effect=ValueError("bad record")
+            ),
+            patch.object(ScheduledTask, "create_task", side_effect=create_task_or_fail),
+        ):
+            good, bad = await asyncio.gather(
+                *[
+                    scheduling_service.schedule_agent_execution(
+                        task_id=uuid.uuid4().hex,
+                        conversation_id=str(conversation_id),
+                        agent_instructions=instructions,
+                        schedule_type="cron",
+                        schedule_config={"hour": 7},
+                    )
+                    for instructions in ("Good", "Bad")
+                ],
+                return_exceptions=True,
+            )
+
+        assert isinstance(bad, ValueError)
+        jobs = scheduling_service.scheduler.get_jobs()
+        assert [job.id for job in jobs] == [good]
+        assert not scheduling_service._unsaved_tasks
+        async with db_service.session_factory() as session:
+            assert await ScheduledTask.get_by_id(session, good) is not None
+
+    @pytest.mark.asyncio
+    async def test_setup_automation_rejects_past_once(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """A "once" time in the past is rejected before reaching the scheduler."""
+        from src.models.schedule_config import OnceSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.tools.scheduling_tools import setup_automation
+
+        ctx, _ = mock_run_context
+        scheduling_service = mock_app_with_real_db.extensions["scheduling"]
+        # The check uses the scheduler's timezone, not the raw config value
+        mock_app_with_real_db.config["TIMEZONE"] = "Not/A_Zone"
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch.object(scheduling_service, "schedule_unless_duplicate") as schedule,
+        ):
+            result = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Too late",
+                schedule_type=ScheduleType.ONCE,
+                schedule_config=OnceSchedule(when="2020-01-01T09:00:00"),
+            )
+
+        assert result["status"] == "error"
+        assert "in the past" in result["message"]
+        schedule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_setup_automation_once_uses_scheduler_timezone(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """A naive "once" time runs in the scheduler's zone, not the host's."""
+        from datetime import datetime
+        from datetime import timedelta
+        from zoneinfo import ZoneInfo
+
+        from src.models.schedule_config import OnceSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.tools.scheduling_tools import setup_automation
+
+        ctx, conversation_id = mock_run_context
+        ctx.deps = {"conversation_id": str(conversation_id)}
+        scheduler = mock_app_with_real_db.extensions["scheduling"].scheduler
+        auckland = ZoneInfo("Pacific/Auckland")
+        when = datetime.now(auckland).replace(microsecond=0) + timedelta(hours=2)
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+            patch.object(scheduler, "timezone", auckland),
+            patch(
+                "apscheduler.triggers.date.get_localzone",
+                return_value=ZoneInfo("America/New_York"),
+            ),
+        ):
+            result = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Call home",
+                schedule_type=ScheduleType.ONCE,
+                schedule_config=OnceSchedule(
+                    when=when.replace(tzinfo=None).isoformat()
+                ),
+            )
+
+        assert result["status"] == "success"
+        assert scheduler.get_job(result["job_id"]).next_run_time == when
+
+    @pytest.mark.asyncio
+    async def test_setup_automation_returns_existing_duplicate(
+        self, mock_app_with_real_db, mock_run_context
+    ):
+        """Re-requesting a live automation returns the existing job."""
+        import asyncio
+
+        from src.models.schedule_config import IntervalSchedule
+        from src.models.schedule_config import ScheduleType
+        from src.tools.scheduling_tools import setup_automation
+
+        ctx, conversation_id = mock_run_context
+        ctx.deps = {"conversation_id": str(conversation_id)}
+        scheduler = mock_app_with_real_db.extensions["scheduling"].scheduler
+
+        with (
+            patch("src.tools.scheduling_tools.current_app", mock_app_with_real_db),
+            patch("src.modules.scheduling_service.current_app", mock_app_with_real_db),
+        ):
+            first = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Check the news",
+                schedule_type=ScheduleType.INTERVAL,
+                schedule_config=IntervalSchedule(hours=6),
+            )
+            second = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Check the news",
+                schedule_type=ScheduleType.INTERVAL,
+                schedule_config=IntervalSchedule(hours=6),
+            )
+            assert second["job_id"] == first["job_id"]
+            assert "already scheduled" in second["message"]
+            assert len(scheduler.get_jobs()) == 1
+
+            # Concurrent identical requests also resolve to the one job
+            concurrent = await asyncio.gather(*[
+                setup_automation(
+                    ctx=ctx,
+                    agent_instructions="Read the paper",
+                    schedule_type=ScheduleType.INTERVAL,
+                    schedule_config=IntervalSchedule(hours=6),
+                )
+                for _ in range(2)
+            ])
+            assert concurrent[0]["job_id"] == concurrent[1]["job_id"]
+            assert len(scheduler.get_jobs()) == 2
+
+            # A different schedule is a new automation
+            third = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Check the news",
+                schedule_type=ScheduleType.INTERVAL,
+                schedule_config=IntervalSchedule(hours=12),
+            )
+            assert third["job_id"] != first["job_id"]
+
+            # Only the row whose schedule matches is checked with the scheduler
+            with patch.object(scheduler, "get_job", wraps=scheduler.get_job) as get_job:
+                repeat = await setup_automation(
+                    ctx=ctx,
+                    agent_instructions="Check the news",
+                    schedule_type=ScheduleType.INTERVAL,
+                    schedule_config=IntervalSchedule(hours=12),
+                )
+            assert repeat["job_id"] == third["job_id"]
+            get_job.assert_called_once_with(third["job_id"])
+
+            # Once the job is gone the same request schedules afresh
+            scheduler.remove_job(first["job_id"])
+            fourth = await setup_automation(
+                ctx=ctx,
+                agent_instructions="Check the news",
+                schedule_type=ScheduleType.INTERVAL,
+                schedule_config=IntervalSchedule(hours=6),
+            )
+            assert fourth["job_id"] != first["job_id"]